@@ -1,138 +1,108 @@
+import os
 import streamlit as st
-import pandas as pd
-import seaborn as sns
-import matplotlib.pyplot as plt
 import plotly.express as px
+import plotly.io as pio
 import numpy as np
-from datetime import datetime
+from charts import bubble_chart_png, heatmap_png
+from data import DATA_PATH, load_data, month_age_totals, month_order, labels
+
+# Default Plotly template, resolved once per process (Matplotlib style is set in charts.py)
+pio.templates.default = "plotly_white"
 
 st.set_page_config(page_title="Investment Analytics Dashboard", layout="wide")
 st.title("📊 Investment Insights Dashboard")
 
 # Load data
-df = pd.read_excel("processed_investment_data.xlsx")
-
-# Clean and process data
-columns_to_keep = ['DOB', 'INVESTMENT YEAR', 'INVESTMENT MONTH', 'LAND', 'UNIT', 'AMOUNT']
-df = df[columns_to_keep].copy()
-df = df.dropna(subset=['DOB', 'AMOUNT'])
-df['DOB'] = pd.to_datetime(df['DOB'], errors='coerce')
-df = df.dropna(subset=['DOB'])
-df['AGE'] = df['DOB'].apply(lambda x: 2025 - x.year if pd.notnull(x) else None)
-
-month_order = ['JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JANUARY']
-df['INVESTMENT MONTH'] = df['INVESTMENT MONTH'].astype(str).str.strip().str.upper()
-df = df[df['INVESTMENT MONTH'].isin(month_order)]
-df['INVESTMENT MONTH'] = pd.Categorical(df['INVESTMENT MONTH'], categories=month_order, ordered=True)
-df['UNIT'] = pd.to_numeric(df['UNIT'], errors='coerce')
-df['AMOUNT'] = pd.to_numeric(df['AMOUNT'], errors='coerce')
-df = df.dropna()
-
-bins = [18, 30, 40, 50, 60, 70, 100]
-labels = ["18-29", "30-39", "40-49", "50-59", "60-69", "70+"]
-df["AGE GROUP"] = pd.cut(df["AGE"], bins=bins, labels=labels, right=False)
-df = df[df["INVESTMENT MONTH"].notna()]
+data_mtime = os.path.getmtime(DATA_PATH)
+df = load_data(DATA_PATH, data_mtime)
+
+# Label -> category code lookups, so filtering compares integer codes instead of labels
+age_code_map = {label: code for code, label in enumerate(df["AGE GROUP"].cat.categories)}
+land_code_map = {label: code for code, label in enumerate(df["LAND"].cat.categories)}
+
+def code_mask(column, code_map, selected):
+    # Labels missing from the map (i.e. NaN) select the -1 code pandas uses for missing values
+    codes = column.cat.codes.to_numpy()
+    wanted = np.array([code_map.get(label, -1) for label in selected], dtype=codes.dtype)
+    return np.isin(codes, wanted)
+
+# Filtered view, cached per sidebar selection (load_data is cached too, so this reuses df)
+@st.cache_data
+def filter_df(mtime, age_groups, lands):
+    df = load_data(DATA_PATH, mtime)
+    # AND the land mask into the age mask in place, reusing its buffer instead of allocating a third array
+    mask = code_mask(df["AGE GROUP"], age_code_map, age_groups)
+    np.logical_and(mask, code_mask(df["LAND"], land_code_map, lands), out=mask)
+    return df[mask].copy()
 
 # Sidebar filters
 st.sidebar.header("Filter Options")
 selected_age_groups = st.sidebar.multiselect("Select Age Groups", options=df["AGE GROUP"].unique(), default=df["AGE GROUP"].unique())
 selected_land_types = st.sidebar.multiselect("Select Land Types", options=df["LAND"].unique(), default=df["LAND"].unique())
 
-filtered_df = df[df["AGE GROUP"].isin(selected_age_groups) & df["LAND"].isin(selected_land_types)]
+filtered_df = filter_df(data_mtime, tuple(sorted(selected_age_groups, key=str)), tuple(sorted(selected_land_types, key=str)))
+
+# Aggregate once by month and age group; the charts below reuse these marginals
+grouped = month_age_totals(filtered_df)
+age_totals = grouped.groupby("AGE GROUP", observed=True)[["AMOUNT", "UNIT"]].sum()
+age_amount_df = age_totals["AMOUNT"].reset_index()
+age_units_df = age_totals["UNIT"].reset_index()
+monthly_investment = grouped.groupby("INVESTMENT MONTH", observed=True)["AMOUNT"].sum().reset_index()
+df_grouped = grouped["AMOUNT"].unstack("AGE GROUP").reindex(index=month_order, columns=labels)
 
 # Metrics
 st.subheader("Key Metrics")
 col1, col2, col3 = st.columns(3)
 col1.metric("Total Investment (₦)", f"{filtered_df['AMOUNT'].sum():,.0f}")
 col2.metric("Total Units Purchased", f"{filtered_df['UNIT'].sum():,.0f}")
-col3.metric("Unique Investors", f"{filtered_df['DOB'].nunique()}")
+# Unique investors are counted by DOB, on its raw int64 nanosecond view
+col3.metric("Unique Investors", f"{np.unique(filtered_df['DOB'].to_numpy().view('i8')).size}")
 
 # Bar chart: Total Amount by Age Group
 st.subheader("💸 Total Investment by Age Group")
-age_amount_df = filtered_df.groupby("AGE GROUP")["AMOUNT"].sum().reset_index()
 fig1 = px.bar(age_amount_df, x="AGE GROUP", y="AMOUNT", color="AGE GROUP", title="Total Investment by Age Group", text_auto=True)
-st.plotly_chart(fig1, use_container_width=True)
+st.plotly_chart(fig1, use_container_width=True, theme=None)
 
 # Land type distribution
 st.subheader("🌍 Land Type Distribution by Age Group")
 fig2 = px.histogram(filtered_df, x="AGE GROUP", color="LAND", barmode="group", title="Land Type Distribution by Age Group")
-st.plotly_chart(fig2, use_container_width=True)
+st.plotly_chart(fig2, use_container_width=True, theme=None)
 
 # Units purchased by age group
 st.subheader("📦 Units Purchased by Age Group")
-age_units_df = filtered_df.groupby("AGE GROUP")["UNIT"].sum().reset_index()
 fig3 = px.bar(age_units_df, x="AGE GROUP", y="UNIT", color="AGE GROUP", text_auto=True, title="Total Units Purchased by Age Group")
-st.plotly_chart(fig3, use_container_width=True)
+st.plotly_chart(fig3, use_container_width=True, theme=None)
 
 # Pie chart
 st.subheader("🥧 Investment Distribution by Age Group")
 fig4 = px.pie(age_amount_df, values="AMOUNT", names="AGE GROUP", title="Proportion of Investment by Age Group")
-st.plotly_chart(fig4, use_container_width=True)
+st.plotly_chart(fig4, use_container_width=True, theme=None)
 
 # Trend over time
 st.subheader("📈 Investment Trend Over Time")
-monthly_investment = filtered_df.groupby("INVESTMENT MONTH")["AMOUNT"].sum().reset_index()
 fig5 = px.line(monthly_investment, x="INVESTMENT MONTH", y="AMOUNT", markers=True, title="Monthly Investment Trend")
-st.plotly_chart(fig5, use_container_width=True)
+st.plotly_chart(fig5, use_container_width=True, theme=None)
 
 # Trend by age group
 st.subheader("📉 Investment Trend by Age Group")
-fig6 = px.line(filtered_df, x="INVESTMENT MONTH", y="AMOUNT", color="AGE GROUP", markers=True, title="Investment Trend by Age Group")
-st.plotly_chart(fig6, use_container_width=True)
+fig6 = px.line(grouped["AMOUNT"].reset_index(), x="INVESTMENT MONTH", y="AMOUNT", color="AGE GROUP", markers=True, title="Investment Trend by Age Group")
+st.plotly_chart(fig6, use_container_width=True, theme=None)
 
 # Additional charts
 st.subheader("📊 Advanced Investment Visualizations")
 
-# Heatmap: Investment Amount by Age Group
-st.markdown("**Heatmap: Investment Amount by Age Group**")
-age_investment_pivot = df.pivot_table(index="AGE GROUP", values="AMOUNT", aggfunc="sum")
-fig, ax = plt.subplots()
-sns.heatmap(age_investment_pivot, annot=True, fmt=".0f", cmap="coolwarm", linewidths=0.5, ax=ax)
-st.pyplot(fig)
-
 # Age group vs. month heatmap
 st.markdown("**Investment Distribution Across Months and Age Groups**")
-age_month_ct = pd.crosstab(df["INVESTMENT MONTH"], df["AGE GROUP"])
-fig, ax = plt.subplots()
-sns.heatmap(age_month_ct, annot=True, cmap="coolwarm", linewidths=0.5, fmt="d", ax=ax)
-st.pyplot(fig)
+age_month_ct = grouped["N"].unstack("AGE GROUP", fill_value=0).reindex(index=month_order, columns=labels, fill_value=0)
+st.image(heatmap_png(age_month_ct, "d"), use_container_width=True)
 
 # Heatmap of investment amount by age group and month
 st.markdown("**Heatmap of Investment Amount by Age Group and Month**")
-heatmap_data = df.pivot_table(index="INVESTMENT MONTH", columns="AGE GROUP", values="AMOUNT", aggfunc="sum", fill_value=0)
-fig, ax = plt.subplots()
-sns.heatmap(heatmap_data, annot=True, fmt=".0f", cmap="coolwarm", linewidths=0.5, ax=ax)
-st.pyplot(fig)
-
-# Stacked bar chart
-st.markdown("**Stacked Bar Chart: Investment by Age Group and Month**")
-df_grouped = df.groupby(["INVESTMENT MONTH", "AGE GROUP"])["AMOUNT"].sum().unstack()
-fig, ax = plt.subplots()
-df_grouped.plot(kind="bar", stacked=True, colormap="viridis", ax=ax)
-plt.title("Stacked Bar Chart: Investment by Age Group and Month")
-plt.xlabel("Investment Month")
-plt.ylabel("Total Investment Amount")
-plt.xticks(rotation=45)
-st.pyplot(fig)
-
-# Grouped bar chart
-st.markdown("**Grouped Bar Chart: Investment by Age Group and Month**")
-fig, ax = plt.subplots()
-df_grouped.plot(kind="bar", stacked=False, colormap="coolwarm", ax=ax)
-plt.title("Grouped Bar Chart: Investment by Age Group and Month")
-plt.xlabel("Investment Month")
-plt.ylabel("Total Investment Amount")
-plt.xticks(rotation=45)
-st.pyplot(fig)
+heatmap_data = df_grouped.fillna(0)
+st.image(heatmap_png(heatmap_data, ".0f"), use_container_width=True)
 
 # Bubble Chart: Investment Amount by Age Group and Month
-fig, ax = plt.subplots(figsize=(12, 6))
-sns.scatterplot(data=filtered_df, x="INVESTMENT MONTH", y="AGE GROUP", size="AMOUNT", hue="AGE GROUP", sizes=(20, 1000), palette="coolwarm", alpha=0.6, ax=ax)
-ax.set_title("Bubble Chart: Investment Amount by Age Group and Month")
-ax.set_xlabel("Investment Month")
-ax.set_ylabel("Age Group")
-ax.legend(title="Investment Amount", bbox_to_anchor=(1.05, 1), loc='upper left')
-st.pyplot(fig)
+st.image(bubble_chart_png(grouped["AMOUNT"].reset_index()), use_container_width=True)
 
 st.markdown("---")
 st.caption("Developed with ❤️ using Streamlit, Seaborn, Matplotlib and Plotly")
@@ -0,0 +1,82 @@
+import io
+import streamlit as st
+import pandas as pd
+import numpy as np
+import seaborn as sns
+import matplotlib as mpl
+from matplotlib import colormaps
+from matplotlib.figure import Figure
+from matplotlib.lines import Line2D
+from data import month_order, labels
+
+# Matplotlib style for every figure in both apps, set once when this module is imported
+mpl.style.use("fast")
+mpl.rcParams['path.simplify'] = True
+mpl.rcParams['path.simplify_threshold'] = 1.0
+mpl.rcParams['agg.path.chunksize'] = 10000
+
+# Charts are cached as rendered PNG bytes keyed by the frames they draw, so unchanged inputs
+# skip rendering on rerun. Figures are built with Figure() rather than pyplot, so no global
+# figure state is shared between session threads.
+frame_hash_funcs = {pd.DataFrame: lambda d: (d.columns.tolist(), pd.util.hash_pandas_object(d).to_numpy().tobytes())}
+
+def figure_png(fig):
+    # Same output settings st.pyplot uses
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=200, bbox_inches="tight")
+    return buffer.getvalue()
+
+@st.cache_data(hash_funcs=frame_hash_funcs)
+def heatmap_png(data, fmt, title=None, xlabel=None, ylabel=None, figsize=None):
+    fig = Figure(figsize=figsize)
+    ax = fig.subplots()
+    sns.heatmap(data, annot=True, fmt=fmt, cmap="coolwarm", linewidths=0.5, ax=ax)
+    if title:
+        ax.set_title(title)
+    if xlabel:
+        ax.set_xlabel(xlabel)
+    if ylabel:
+        ax.set_ylabel(ylabel)
+    return figure_png(fig)
+
+@st.cache_data(hash_funcs=frame_hash_funcs)
+def month_bar_chart_png(data, stacked, colormap, title):
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    data.plot(kind="bar", stacked=stacked, colormap=colormap, ax=ax)
+    ax.set_title(title)
+    ax.set_xlabel("Investment Month")
+    ax.set_ylabel("Total Investment Amount")
+    ax.legend(title="Age Group")
+    ax.set_xticklabels(data.index, rotation=45)
+    return figure_png(fig)
+
+@st.cache_data(hash_funcs=frame_hash_funcs)
+def bubble_chart_png(data):
+    # data holds one row per (month, age group) cell, drawn with a single scatter call;
+    # bubble area scales linearly with AMOUNT over the same 20-1000 range seaborn used
+    fig = Figure(figsize=(12, 6))
+    ax = fig.subplots()
+    amount = data["AMOUNT"].to_numpy(dtype="float64")
+    if len(amount):
+        low, span = amount.min(), np.ptp(amount)
+        sizes = 20 + (amount - low) / span * 980 if span else np.full(len(amount), 510.0)
+        age_codes = data["AGE GROUP"].cat.codes.to_numpy()
+        colors = colormaps["coolwarm"](age_codes / (len(labels) - 1))
+        points = ax.scatter(data["INVESTMENT MONTH"].cat.codes.to_numpy(), age_codes, s=sizes, c=colors, alpha=0.6)
+        if span:
+            handles, amount_labels = points.legend_elements("sizes", num=4, fmt="{x:,.0f}", func=lambda s: low + (s - 20) / 980 * span)
+        else:
+            # Every bubble has the same size, which legend_elements() cannot build entries from
+            handles = [Line2D([], [], linestyle="", marker="o", markersize=np.sqrt(510.0), color="grey", alpha=0.6)]
+            amount_labels = [f"{low:,.0f}"]
+        ax.legend(handles, amount_labels, title="Investment Amount", bbox_to_anchor=(1.05, 1), loc='upper left')
+    # Pad the categorical axes like seaborn did, so edge bubbles are not clipped
+    ax.set_xticks(range(len(month_order)), month_order)
+    ax.set_yticks(range(len(labels)), labels)
+    ax.set_xlim(-0.5, len(month_order) - 0.5)
+    ax.set_ylim(-0.5, len(labels) - 0.5)
+    ax.set_title("Bubble Chart: Investment Amount by Age Group and Month")
+    ax.set_xlabel("Investment Month")
+    ax.set_ylabel("Age Group")
+    return figure_png(fig)
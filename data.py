@@ -0,0 +1,106 @@
+import os
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+DATA_PATH = "processed_investment_data.xlsx"
+CACHE_DIR = ".cache"
+CACHE_VERSION = 7  # bump whenever load_data() changes its output
+SIDECAR_PATH = os.path.join(CACHE_DIR, "clean.feather")
+SIGNATURE_PATH = os.path.join(CACHE_DIR, "clean.sig")
+month_order = ['JULY', 'AUGUST', 'SEPTEMBER', 'OCTOBER', 'NOVEMBER', 'DECEMBER', 'JANUARY']
+bins = [18, 30, 40, 50, 60, 70, 100]
+labels = ["18-29", "30-39", "40-49", "50-59", "60-69", "70+"]
+
+# Identifies the workbook (and pipeline version) the Feather sidecar was built from
+def source_signature(path):
+    stat = os.stat(path)
+    return f"{CACHE_VERSION}:{os.path.abspath(path)}:{stat.st_mtime}:{stat.st_size}"
+
+# Load data (cached across reruns, with a Feather sidecar for cold starts)
+@st.cache_data
+def load_data(path, mtime):
+    signature = source_signature(path)
+    try:
+        with open(SIGNATURE_PATH) as f:
+            if f.read() == signature:
+                return pd.read_feather(SIDECAR_PATH)
+    except (ImportError, OSError, ValueError):
+        pass
+
+    columns_to_keep = ['DOB', 'INVESTMENT YEAR', 'INVESTMENT MONTH', 'LAND', 'UNIT', 'AMOUNT']
+    read_options = dict(usecols=columns_to_keep, dtype={'INVESTMENT MONTH': 'string', 'LAND': 'string'}, parse_dates=['DOB'])
+    try:
+        df = pd.read_excel(path, engine="calamine", **read_options)
+    except ImportError:
+        # python-calamine is optional; fall back to pandas' default engine (openpyxl)
+        df = pd.read_excel(path, **read_options)
+
+    # Clean and process data
+    df = df.dropna(subset=['DOB', 'AMOUNT'])
+    if not pd.api.types.is_datetime64_any_dtype(df['DOB']):
+        # parse_dates leaves DOB as objects if any cell isn't a date; coerce those to NaT
+        df['DOB'] = pd.to_datetime(df['DOB'], errors='coerce')
+        df = df.dropna(subset=['DOB'])
+    df['AGE'] = (2025 - df['DOB'].dt.year).astype('int16')
+    df['INVESTMENT MONTH'] = df['INVESTMENT MONTH'].astype(str).str.strip().str.upper()
+    df = df[df['INVESTMENT MONTH'].isin(month_order)]
+    df['INVESTMENT MONTH'] = pd.Categorical(df['INVESTMENT MONTH'], categories=month_order, ordered=True)
+    df['UNIT'] = pd.to_numeric(df['UNIT'], errors='coerce')
+    df['AMOUNT'] = pd.to_numeric(df['AMOUNT'], errors='coerce')
+    df = df.dropna()
+    # Naira totals are summed in AMOUNT's own dtype, so keep it exact: int64 for whole amounts, else float64
+    if (df['AMOUNT'] % 1 == 0).all():
+        df['AMOUNT'] = df['AMOUNT'].astype('int64')
+    df['UNIT'] = pd.to_numeric(df['UNIT'], downcast='integer')
+    df['LAND'] = df['LAND'].astype(str).str.strip().str.upper().astype('category')
+    # Same left-closed bins as pd.cut(..., right=False); ages outside them get code -1 (NaN)
+    codes = np.searchsorted(bins, df["AGE"].to_numpy(), side="right") - 1
+    codes[(codes < 0) | (codes >= len(labels))] = -1
+    df["AGE GROUP"] = pd.Categorical.from_codes(codes, categories=labels, ordered=True)
+    # Feather needs a default RangeIndex
+    df = df[df["INVESTMENT MONTH"].notna()].reset_index(drop=True)
+
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if os.path.exists(SIGNATURE_PATH):
+            os.remove(SIGNATURE_PATH)
+        df.to_feather(SIDECAR_PATH)
+        # Written only once the Feather file is complete, so a failed write is never picked up
+        with open(SIGNATURE_PATH, "w") as f:
+            f.write(signature)
+    except (ImportError, OSError):
+        pass
+    return df
+
+def load_clean_data(path=DATA_PATH):
+    return load_data(path, os.path.getmtime(path))
+
+# Month x age group AMOUNT/UNIT sums and row counts in one pass: the two category codes form a
+# dense cell index into a small len(month_order) x len(labels) grid, so np.bincount does the
+# group-and-sum without a hash table. Returns the observed cells only, indexed like
+# groupby(["INVESTMENT MONTH", "AGE GROUP"], observed=True).
+def month_age_totals(df):
+    month_codes = df["INVESTMENT MONTH"].cat.codes.to_numpy()
+    age_codes = df["AGE GROUP"].cat.codes.to_numpy()
+    keep = (month_codes >= 0) & (age_codes >= 0)
+    cells = month_codes[keep].astype(np.intp) * len(labels) + age_codes[keep]
+    size = len(month_order) * len(labels)
+    counts = np.bincount(cells, minlength=size)
+    observed = np.flatnonzero(counts)
+
+    totals = {}
+    for column in ['AMOUNT', 'UNIT']:
+        # bincount accumulates in float64; integer columns are returned as int64 like a groupby sum
+        sums = np.bincount(cells, weights=df[column].to_numpy(dtype="float64")[keep], minlength=size)[observed]
+        totals[column] = sums.astype("int64") if pd.api.types.is_integer_dtype(df[column]) else sums
+    totals['N'] = counts[observed]
+
+    index = pd.MultiIndex.from_arrays(
+        [
+            pd.Categorical.from_codes(observed // len(labels), categories=month_order, ordered=True),
+            pd.Categorical.from_codes(observed % len(labels), categories=labels, ordered=True),
+        ],
+        names=["INVESTMENT MONTH", "AGE GROUP"],
+    )
+    return pd.DataFrame(totals, index=index)